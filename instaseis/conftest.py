@@ -28,6 +28,25 @@ def add_test_files(doctest_namespace):
     doctest_namespace["quakeml_file"] = os.path.join(TEST_DATA, "quake.xml")
 
 
+@pytest.fixture(scope="session")
+def open_cached_db():
+    """
+    Returns a function that opens each database only once per test session.
+
+    Only use it for tests that do not depend on the state of the buffers of
+    a database. The databases are shared between tests so tests must not
+    modify them, e.g. by assigning to ``db.info``.
+    """
+    dbs = {}
+
+    def _open(path):
+        if path not in dbs:
+            dbs[path] = instaseis.open_db(path)
+        return dbs[path]
+
+    return _open
+
+
 def repack_databases():
     """
     Repack databases and create a couple of temporary test databases.
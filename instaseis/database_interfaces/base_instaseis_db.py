@@ -11,7 +11,11 @@ Abstract base class for all Instaseis database classes.
     (http://www.gnu.org/copyleft/lgpl.html)
 """
 from abc import ABCMeta, abstractmethod
-from distutils.version import LooseVersion
+import collections
+import concurrent.futures
+import contextlib
+from functools import lru_cache
+import itertools
 import math
 import warnings
 
@@ -19,11 +23,11 @@ import numpy as np
 from obspy.core import AttribDict, Stream, Trace, UTCDateTime
 from obspy.geodetics import locations2degrees
 from obspy.signal.interpolation import lanczos_interpolation
-from scipy.integrate import cumtrapz
-import scipy.signal
+import scipy.fft
+import scipy.signal.windows
 
 from ..source import Source, ForceSource, Receiver, FiniteSource
-from ..helpers import get_band_code, sizeof_fmt, rfftfreq
+from ..helpers import get_band_code, sizeof_fmt, rfftfreq, cached_property
 
 
 DEFAULT_MU = 32e9
@@ -45,19 +49,117 @@ STF_MAP = {
 }
 
 
-def _diff_and_integrate(n_derivative, data, comp, dt_out):
-    for _ in np.arange(n_derivative):
-        # In some numpy version there is an incompatibility here - 1.11
-        # works for both so we branch here.
-        if LooseVersion(np.__version__) >= LooseVersion("1.11.0"):
-            data[comp] = np.gradient(data[comp], dt_out)
-        else:  # pragma: no cover
-            data[comp] = np.gradient(data[comp], [dt_out])
+def _gradient(data, dx):
+    """
+    Same as ``np.gradient(data, dx, axis=-1)`` for a scalar spacing but
+    without the generic argument handling and intermediate arrays.
+
+    Central differences in the interior and one-sided differences at the
+    boundaries.
+    """
+    out = np.empty_like(data)
+    np.subtract(data[..., 2:], data[..., :-2], out=out[..., 1:-1])
+    out[..., 1:-1] /= 2.0 * dx
+    out[..., 0] = (data[..., 1] - data[..., 0]) / dx
+    out[..., -1] = (data[..., -1] - data[..., -2]) / dx
+    return out
+
+
+def _cumtrapz(data, dx):
+    """
+    Cumulative trapezoidal integration along the last axis with a zero
+    prepended so the result has the same length as the input.
+
+    Same as ``scipy.integrate.cumtrapz(data, dx=dx, initial=0.0, axis=-1)``
+    in a single pass writing directly into the output array.
+    """
+    out = np.empty_like(data)
+    out[..., 0] = 0.0
+    np.add(data[..., 1:], data[..., :-1], out=out[..., 1:])
+    out[..., 1:] *= dx
+    out[..., 1:] /= 2.0
+    np.cumsum(out[..., 1:], axis=-1, out=out[..., 1:])
+    return out
+
+
+def _diff_and_integrate(n_derivative, data, dt_out):
+    """
+    Differentiate (positive ``n_derivative``) or integrate (negative
+    ``n_derivative``) the data along its last axis.
+
+    Multiple traces of the same length can be passed as a 2D array and are
+    processed at once.
+    """
+    for _ in range(n_derivative):
+        data = _gradient(data, dt_out)
 
     # Cannot happen currently - maybe with other source time functions?
-    for _ in np.arange(-n_derivative):  # pragma: no cover
+    for _ in range(-n_derivative):  # pragma: no cover
         # adding a zero at the beginning to avoid phase shift
-        data[comp] = cumtrapz(data[comp], dx=dt_out, initial=0.0)
+        data = _cumtrapz(data, dt_out)
+
+    return data
+
+
+def _phase_ramp(nfft, time_shift, dt):
+    """
+    Spectrum of a time shift by ``time_shift`` seconds for a real valued
+    signal with ``nfft`` samples and a sampling interval of ``dt``.
+
+    Not cached as the time shift usually differs for every source, e.g. for
+    all point sources of a finite source.
+    """
+    return np.exp(-1j * rfftfreq(nfft) * 2.0 * np.pi * time_shift / dt)
+
+
+@lru_cache(maxsize=64)
+def _end_taper(npts):
+    """
+    Taper applied before reconvolving the source time function.
+
+    Tapers the last 5 percent but at least 5 samples. The first sample is
+    guaranteed to be zero in any case. Cached as it only depends on the
+    number of samples. The returned array is read-only.
+    """
+    tlen = max(int(math.ceil(0.05 * npts)), 5)
+    taper = np.ones(npts)
+    taper[-tlen:] = scipy.signal.windows.hann(tlen * 2)[tlen:]
+    taper.flags.writeable = False
+    return taper
+
+
+def _ordered_map(func, items, max_workers=None):
+    """
+    Yield ``func(item)`` for all items in order.
+
+    Runs serially in the calling thread unless ``max_workers`` is larger
+    than one. Otherwise at most ``2 * max_workers`` items are processed or
+    waiting to be consumed at any time so the memory usage does not grow
+    with the number of items.
+    """
+    if not max_workers or max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    items = iter(items)
+    pending = collections.deque()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers
+    ) as executor:
+        try:
+            for item in itertools.islice(items, 2 * max_workers):
+                pending.append(executor.submit(func, item))
+            while pending:
+                result = pending.popleft().result()
+                for item in itertools.islice(items, 1):
+                    pending.append(executor.submit(func, item))
+                yield result
+        finally:
+            # Don't start any pending work after an error or if the consumer
+            # stopped early.
+            for future in pending:
+                future.cancel()
 
 
 class BaseInstaseisDB(metaclass=ABCMeta):
@@ -299,15 +401,20 @@ class BaseInstaseisDB(metaclass=ABCMeta):
             source=source, receiver=receiver, components=components
         )
 
+        # Look up the database parameters used below only once.
+        info = self.info
+        db_dt = info.dt
+        nfft = info.nfft
+        npts = info.npts
+        stf_type = STF_MAP[info.stf]
+
         if dt is None:
-            dt_out = self.info.dt
+            dt_out = db_dt
         else:
             dt_out = dt
 
-        stf_deconv_map = {0: self.info.sliprate, 1: self.info.slip}
-
         # Can never be negative with the current logic.
-        n_derivative = KIND_MAP[kind] - STF_MAP[self.info.stf]
+        n_derivative = KIND_MAP[kind] - stf_type
 
         if isinstance(source, ForceSource):
             n_derivative += 1
@@ -320,7 +427,7 @@ class BaseInstaseisDB(metaclass=ABCMeta):
 
         # Calculate the final time information about the seismograms.
         time_information = _get_seismogram_times(
-            info=self.info,
+            info=info,
             origin_time=source.origin_time,
             dt=dt,
             kernelwidth=kernelwidth,
@@ -328,45 +435,43 @@ class BaseInstaseisDB(metaclass=ABCMeta):
             reconvolve_stf=reconvolve_stf,
         )
 
-        for comp in components:
-            if reconvolve_stf:
-                # We assume here that the sliprate is well-behaved,
-                # e.g. zeros at the boundaries and no energy above the mesh
-                # resolution.
-                if source.dt is None or source.sliprate is None:
-                    raise ValueError("source has no source time function")
-
-                if STF_MAP[self.info.stf] not in [0, 1]:
-                    raise NotImplementedError(
-                        "deconvolution not implemented for stf %s"
-                        % (self.info.stf)
-                    )
-
-                stf_deconv_f = np.fft.rfft(
-                    stf_deconv_map[STF_MAP[self.info.stf]], n=self.info.nfft
+        if reconvolve_stf:
+            # We assume here that the sliprate is well-behaved,
+            # e.g. zeros at the boundaries and no energy above the mesh
+            # resolution.
+            if source.dt is None or source.sliprate is None:
+                raise ValueError("source has no source time function")
+
+            if stf_type not in [0, 1]:
+                raise NotImplementedError(
+                    "deconvolution not implemented for stf %s" % (info.stf)
                 )
 
-                if abs((source.dt - self.info.dt) / self.info.dt) > 1e-7:
-                    raise ValueError("dt of the source not compatible")
+            if abs((source.dt - db_dt) / db_dt) > 1e-7:
+                raise ValueError("dt of the source not compatible")
+
+            # All components have the same length - process them at once.
+            comp_data = np.array([data[comp] for comp in components])
+            taper = _end_taper(comp_data.shape[1])
+
+            if not source.time_shift and self._is_database_stf(
+                source.sliprate
+            ):
+                # Reconvolving the source time function of the database
+                # itself does not change the data - only the taper remains.
+                comp_data = taper * comp_data
+            else:
+                # The spectral ratio of the new and the old source time
+                # function is the same for all components.
+                stf_deconv_f = self._stf_deconv_f
 
-                stf_conv_f = np.fft.rfft(source.sliprate, n=self.info.nfft)
+                # scipy.fft keeps single precision input in single precision.
+                stf_conv_f = scipy.fft.rfft(
+                    np.asarray(source.sliprate, dtype=np.float64), n=nfft
+                )
 
                 if source.time_shift is not None:
-                    stf_conv_f *= np.exp(
-                        -1j
-                        * rfftfreq(self.info.nfft)
-                        * 2.0
-                        * np.pi
-                        * source.time_shift
-                        / self.info.dt
-                    )
-
-                # Apply a 5 percent, at least 5 samples taper at the end.
-                # The first sample is guaranteed to be zero in any case.
-                tlen = max(int(math.ceil(0.05 * len(data[comp]))), 5)
-                taper = np.ones_like(data[comp])
-                taper[-tlen:] = scipy.signal.hann(tlen * 2)[tlen:]
-                dataf = np.fft.rfft(taper * data[comp], n=self.info.nfft)
+                    stf_conv_f *= _phase_ramp(nfft, source.time_shift, db_dt)
 
                 # Ensure numerical stability by not dividing with zero.
                 f = stf_conv_f
@@ -375,13 +480,26 @@ class BaseInstaseisDB(metaclass=ABCMeta):
                 f[_idx] /= stf_deconv_f[_idx]
                 f[_l == 0] = 0 + 0j
 
-                data[comp] = np.fft.irfft(dataf * f)[: self.info.npts]
+                dataf = scipy.fft.rfft(taper * comp_data, n=nfft, axis=1)
+
+                # The spectra are temporary so the multiplication and the
+                # inverse transform can work on the same buffer.
+                dataf *= f
+                comp_data = scipy.fft.irfft(dataf, axis=1, overwrite_x=True)[
+                    :, :npts
+                ]
+
+            for _i, comp in enumerate(components):
+                data[comp] = comp_data[_i]
 
-            if dt is not None:
+        # Each step below only runs if actually requested so that the common
+        # case without resampling and differentiation just cuts the data.
+        if dt is not None:
+            for comp in components:
                 data[comp] = lanczos_interpolation(
                     data=np.require(data[comp], requirements=["C"]),
                     old_start=0,
-                    old_dt=self.info.dt,
+                    old_dt=db_dt,
                     new_start=time_information["time_shift_at_beginning"],
                     new_dt=dt,
                     new_npts=time_information["npts_before_shift_removal"],
@@ -389,24 +507,25 @@ class BaseInstaseisDB(metaclass=ABCMeta):
                     window="blackman",
                 )
 
-            # Integrate/differentiate before removing the source shift in
-            # order to reduce boundary effects at the start of the signal.
-            #
-            # NEVER to this before the resampling! The error can be really big.
-            if n_derivative:
-                _diff_and_integrate(
-                    n_derivative=n_derivative,
-                    data=data,
-                    comp=comp,
-                    dt_out=dt_out,
-                )
+        # Integrate/differentiate before removing the source shift in
+        # order to reduce boundary effects at the start of the signal.
+        #
+        # NEVER to this before the resampling! The error can be really big.
+        if n_derivative:
+            comp_data = _diff_and_integrate(
+                n_derivative=n_derivative,
+                data=np.array([data[comp] for comp in components]),
+                dt_out=dt_out,
+            )
+            for _i, comp in enumerate(components):
+                data[comp] = comp_data[_i]
 
-            # If desired, remove the samples before the peak of the source
-            # time function.
-            if remove_source_shift:
-                data[comp] = data[comp][
-                    time_information["ref_sample"] :  # NOQA
-                ]
+        # If desired, remove the samples before the peak of the source
+        # time function.
+        if remove_source_shift:
+            ref_sample = time_information["ref_sample"]
+            for comp in components:
+                data[comp] = data[comp][ref_sample:]
 
         if return_obspy_stream:
             return self._convert_to_stream(
@@ -475,6 +594,7 @@ class BaseInstaseisDB(metaclass=ABCMeta):
         kernelwidth=12,
         correct_mu=False,
         progress_callback=None,
+        max_workers=None,
     ):
         """
         Extract seismograms for a finite source from an Instaseis database.
@@ -509,6 +629,10 @@ class BaseInstaseisDB(metaclass=ABCMeta):
             sources for each calculated source. Useful for integration into
             user interfaces to provide some kind of progress information. If
             the callback returns ``True``, the calculation will be cancelled.
+        :type max_workers: int, optional
+        :param max_workers: Number of threads used to extract the seismograms
+            of the individual point sources. By default they are extracted
+            one after the other in the calling thread.
 
         :returns: Multi component finite source seismogram.
         :rtype: :class:`obspy.core.stream.Stream`
@@ -516,52 +640,75 @@ class BaseInstaseisDB(metaclass=ABCMeta):
         if components is None:
             components = self.default_components
 
-        if not self.info.is_reciprocal:
+        # Look up the database parameters used below only once.
+        info = self.info
+        db_dt = info.dt
+        npts = info.npts
+        stf_type = STF_MAP[info.stf]
+
+        if not info.is_reciprocal:
             raise NotImplementedError
 
-        data_summed = {}
-        count = len(sources)
-        for _i, source in enumerate(sources):
+        def _get_seismograms(source):
             # Don't perform the diff/integration here, but after the
             # resampling later on.
-            data = self.get_seismograms(
+            return self.get_seismograms(
                 source,
                 receiver,
                 components,
                 reconvolve_stf=True,
                 # Effectively results in nothing happening.
-                kind=INV_KIND_MAP[STF_MAP[self.info.stf]],
+                kind=INV_KIND_MAP[stf_type],
                 return_obspy_stream=False,
                 remove_source_shift=False,
             )
 
-            if correct_mu:
-                corr_fac = (data["mu"] / DEFAULT_MU,)
-            else:
-                corr_fac = 1
-
-            for comp in components:
-                if comp in data_summed:
-                    data_summed[comp] += data[comp] * corr_fac
-                else:
-                    data_summed[comp] = data[comp] * corr_fac
-            # Only used for the GUI.
-            if progress_callback:  # pragma: no cover
-                cancel = progress_callback(_i + 1, count)
-                if cancel:
-                    return None
+        count = len(sources)
+        ncomp = len(components)
+
+        # The (mu corrected) seismograms are staged in blocks of sources and
+        # each block is then summed with a single matrix-vector product.
+        block_size = min(count, 64)
+        staged = np.empty((block_size, ncomp, npts), dtype=np.float64)
+        weights = np.ones(block_size, dtype=np.float64)
+        summed = np.zeros(ncomp * npts, dtype=np.float64)
+
+        # The extraction is dominated by I/O and numerical work that releases
+        # the GIL so the point sources can optionally be extracted in
+        # parallel. The results are always summed in the order of the sources
+        # to get reproducible seismograms.
+        results = _ordered_map(
+            _get_seismograms, sources, max_workers=max_workers
+        )
+        with contextlib.closing(results):
+            for _i, data in enumerate(results):
+                _j = _i % block_size
+                for _k, comp in enumerate(components):
+                    staged[_j, _k] = data[comp]
+                if correct_mu:
+                    weights[_j] = data["mu"] / DEFAULT_MU
+
+                if _j == block_size - 1 or _i == count - 1:
+                    n = _j + 1
+                    summed += np.dot(weights[:n], staged[:n].reshape(n, -1))
+
+                # Only used for the GUI.
+                if progress_callback:  # pragma: no cover
+                    cancel = progress_callback(_i + 1, count)
+                    if cancel:
+                        return None
+
+        data_summed = dict(zip(components, summed.reshape(ncomp, npts)))
 
         if dt is not None:
+            # We don't need to align a sample to the peak of the source
+            # time function here.
+            new_npts = int(round((npts - 1) * db_dt / dt, 6) + 1)
             for comp in components:
-                # We don't need to align a sample to the peak of the source
-                # time function here.
-                new_npts = int(
-                    round((len(data[comp]) - 1) * self.info.dt / dt, 6) + 1
-                )
                 data_summed[comp] = lanczos_interpolation(
                     data=np.require(data_summed[comp], requirements=["C"]),
                     old_start=0,
-                    old_dt=self.info.dt,
+                    old_dt=db_dt,
                     new_start=0,
                     new_dt=dt,
                     new_npts=new_npts,
@@ -577,28 +724,28 @@ class BaseInstaseisDB(metaclass=ABCMeta):
                 #
                 # Also don't cut it for the "identify" interpolation which is
                 # important for testing.
-                if round(dt / self.info.dt, 6) != 1.0:
-                    affected_area = kernelwidth * self.info.dt
+                if round(dt / db_dt, 6) != 1.0:
+                    affected_area = kernelwidth * db_dt
                     data_summed[comp] = data_summed[comp][
                         : -int(np.ceil(affected_area / dt))
                     ]
 
         if dt is None:
-            dt_out = self.info.dt
+            dt_out = db_dt
         else:
             dt_out = dt
 
         # Integrate/differentiate here. No need to do it for every single
         # seismogram and stack the errors.
-        n_derivative = KIND_MAP[kind] - STF_MAP[self.info.stf]
+        n_derivative = KIND_MAP[kind] - stf_type
         if n_derivative:
-            for comp in data_summed.keys():
-                _diff_and_integrate(
-                    n_derivative=n_derivative,
-                    data=data_summed,
-                    comp=comp,
-                    dt_out=dt_out,
-                )
+            comp_data = _diff_and_integrate(
+                n_derivative=n_derivative,
+                data=np.array([data_summed[comp] for comp in components]),
+                dt_out=dt_out,
+            )
+            for _i, comp in enumerate(components):
+                data_summed[comp] = comp_data[_i]
 
         # Convert to an ObsPy Stream object.
         st = Stream()
@@ -815,14 +962,45 @@ class BaseInstaseisDB(metaclass=ABCMeta):
 
         return source, receiver
 
-    @property
+    @cached_property
     def info(self):
-        try:
-            return self.__cached_info
-        except Exception:
-            pass
-        self.__cached_info = AttribDict(self._get_info())
-        return self.__cached_info
+        return AttribDict(self._get_info())
+
+    @cached_property
+    def _stf_deconv(self):
+        """
+        Source time function used in the AxiSEM run that is deconvolved when
+        reconvolving another one.
+        """
+        stf_deconv_map = {0: self.info.sliprate, 1: self.info.slip}
+        return stf_deconv_map[STF_MAP[self.info.stf]]
+
+    @cached_property
+    def _stf_deconv_f(self):
+        """
+        Spectrum of the source time function used in the AxiSEM run.
+
+        Only depends on the database so it is computed once and then shared
+        by all extractions that deconvolve it.
+        """
+        # The source time functions are stored in single precision but
+        # scipy.fft would then also compute the spectrum in single precision.
+        stf_deconv_f = scipy.fft.rfft(
+            np.asarray(self._stf_deconv, dtype=np.float64), n=self.info.nfft
+        )
+        stf_deconv_f.flags.writeable = False
+        return stf_deconv_f
+
+    def _is_database_stf(self, sliprate):
+        """
+        Whether ``sliprate`` is exactly the source time function used in the
+        AxiSEM run so that reconvolving it is the identity operation.
+        """
+        # Frequencies without energy in the original source time function
+        # would be removed by the reconvolution.
+        return np.array_equal(sliprate, self._stf_deconv) and bool(
+            np.all(self._stf_deconv_f != 0)
+        )
 
     def _repr_pretty_(self, p, cycle):  # pragma: no cover
         p.text(str(self))
@@ -982,8 +1160,9 @@ def _get_seismogram_times(
 
             # If it cleanly divides within ten microseconds,
             # make integer based calculations.
-            if round(info.src_shift / dt, 5) % 1.0 == 0:
-                ref_sample = int(round(info.src_shift / dt, 5))
+            src_shift_in_samples = round(info.src_shift / dt, 5)
+            if src_shift_in_samples % 1.0 == 0:
+                ref_sample = int(src_shift_in_samples)
                 shift = (info.src_shift_samples * info.dt) - (ref_sample * dt)
                 shift = round(shift, 6)
                 duration = (info.npts - 1) * info.dt - shift
@@ -255,7 +255,8 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
         xi,
         eta,
     ):
-        if id_elem not in mesh.strain_buffer:
+        strain = mesh.strain_buffer.get(id_elem)
+        if strain is None:
             # Single precision in the NetCDF files but the later interpolation
             # routines require double precision. Assignment to this array will
             # force a cast.
@@ -340,15 +341,10 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
             )
 
             mesh.strain_buffer.add(id_elem, strain)
-        else:
-            strain = mesh.strain_buffer.get(id_elem)
-
-        final_strain = np.empty((strain.shape[0], 6), order="F")
 
-        for i in range(6):
-            final_strain[:, i] = spectral_basis.lagrange_interpol_2D_td(
-                col_points_xi, col_points_eta, strain[:, :, :, i], xi, eta
-            )
+        final_strain = spectral_basis.lagrange_interpol_2D_td_batch(
+            col_points_xi, col_points_eta, strain, xi, eta
+        )
 
         if not mesh.excitation_type == "monopole":
             final_strain[:, 3] *= -1.0
@@ -357,7 +353,8 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
         return final_strain
 
     def _get_strain(self, mesh, id_elem):
-        if id_elem not in mesh.strain_buffer:
+        final_strain = mesh.strain_buffer.get(id_elem)
+        if final_strain is None:
             strain_temp = np.zeros((self.info.npts, 6), order="F")
 
             mesh_dict = mesh.f["Snapshots"]
@@ -401,8 +398,6 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
             final_strain[:, 4] = strain_temp[:, 1]
             final_strain[:, 5] = -strain_temp[:, 3]
             mesh.strain_buffer.add(id_elem, final_strain)
-        else:
-            final_strain = mesh.strain_buffer.get(id_elem)
 
         return final_strain
 
@@ -416,7 +411,8 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
         xi,
         eta,
     ):
-        if id_elem not in mesh.displ_buffer:
+        utemp = mesh.displ_buffer.get(id_elem)
+        if utemp is None:
             utemp = np.zeros(
                 (mesh.ndumps, mesh.npol + 1, mesh.npol + 1, 3),
                 dtype=np.float64,
@@ -459,15 +455,10 @@ class BaseNetCDFInstaseisDB(BaseInstaseisDB, metaclass=ABCMeta):
                             ]
 
             mesh.displ_buffer.add(id_elem, utemp)
-        else:
-            utemp = mesh.displ_buffer.get(id_elem)
-
-        final_displacement = np.empty((utemp.shape[0], 3), order="F")
 
-        for i in range(3):
-            final_displacement[:, i] = spectral_basis.lagrange_interpol_2D_td(
-                col_points_xi, col_points_eta, utemp[:, :, :, i], xi, eta
-            )
+        final_displacement = spectral_basis.lagrange_interpol_2D_td_batch(
+            col_points_xi, col_points_eta, utemp, xi, eta
+        )
 
         return final_displacement
 
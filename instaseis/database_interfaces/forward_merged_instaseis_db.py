@@ -104,7 +104,8 @@ class ForwardMergedInstaseisDB(BaseNetCDFInstaseisDB):
             raise NotImplementedError
 
         # Get from netcdf file or buffer.
-        if ei.id_elem not in self.parsed_mesh.displ_buffer:
+        utemp = self.parsed_mesh.displ_buffer.get(ei.id_elem)
+        if utemp is None:
             utemp = self.meshes.merged.f["MergedSnapshots"][ei.id_elem]
 
             # utemp is currently (nvars, jpol, ipol, npts)
@@ -116,90 +117,16 @@ class ForwardMergedInstaseisDB(BaseNetCDFInstaseisDB):
             utemp = np.rollaxis(utemp, 3, 2)
 
             self.parsed_mesh.displ_buffer.add(ei.id_elem, utemp)
-        else:
-            utemp = self.parsed_mesh.displ_buffer.get(ei.id_elem)
-
-        displ_1 = np.zeros((utemp.shape[0], 3), order="F")
-        displ_2 = np.zeros((utemp.shape[0], 3), order="F")
-        displ_3 = np.zeros((utemp.shape[0], 3), order="F")
-        displ_4 = np.zeros((utemp.shape[0], 3), order="F")
 
-        # Now just fill them all.
-        # displ_1 is generated from MZZ which has only two displacement
-        # components.
-        displ_1[:, 0] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 0],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_1[:, 2] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 1],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        # displ_2 is generated from MXX+MYY which has only two displacement
-        # components.
-        displ_2[:, 0] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 2],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_2[:, 2] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 3],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        # displ_3 is generated from MXZ/MYZ which has three displacement
-        # components.
-        displ_3[:, 0] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 4],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_3[:, 1] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 5],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_3[:, 2] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 6],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        # displ_3 is generated from MXY/MXX-MYY which has three displacement
-        # components.
-        displ_4[:, 0] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 7],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_4[:, 1] = spectral_basis.lagrange_interpol_2D_td(
-            points1=ei.col_points_xi,
-            points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 8],
-            x1=ei.xi,
-            x2=ei.eta,
-        )
-        displ_4[:, 2] = spectral_basis.lagrange_interpol_2D_td(
+        # Columns of displ:
+        # 0, 1: MZZ with s and z displacement components.
+        # 2, 3: MXX+MYY with s and z displacement components.
+        # 4, 5, 6: MXZ/MYZ with s, phi, and z displacement components.
+        # 7, 8, 9: MXY/MXX-MYY with s, phi, and z displacement components.
+        displ = spectral_basis.lagrange_interpol_2D_td_batch(
             points1=ei.col_points_xi,
             points2=ei.col_points_eta,
-            coefficients=utemp[:, :, :, 9],
+            coefficients=utemp,
             x1=ei.xi,
             x2=ei.eta,
         )
@@ -207,13 +134,13 @@ class ForwardMergedInstaseisDB(BaseNetCDFInstaseisDB):
         mij = source.tensor / self.parsed_mesh.amplitude
         # mij is [m_rr, m_tt, m_pp, m_rt, m_rp, m_tp]
         # final is in s, phi, z coordinates
-        final = np.zeros((displ_1.shape[0], 3), dtype="float64")
+        final = np.zeros((displ.shape[0], 3), dtype="float64")
 
-        final[:, 0] += displ_1[:, 0] * mij[0]
-        final[:, 2] += displ_1[:, 2] * mij[0]
+        final[:, 0] += displ[:, 0] * mij[0]
+        final[:, 2] += displ[:, 1] * mij[0]
 
-        final[:, 0] += displ_2[:, 0] * (mij[1] + mij[2])
-        final[:, 2] += displ_2[:, 2] * (mij[1] + mij[2])
+        final[:, 0] += displ[:, 2] * (mij[1] + mij[2])
+        final[:, 2] += displ[:, 3] * (mij[1] + mij[2])
 
         fac_1 = mij[3] * np.cos(coordinates.phi) + mij[4] * np.sin(
             coordinates.phi
@@ -222,9 +149,9 @@ class ForwardMergedInstaseisDB(BaseNetCDFInstaseisDB):
             coordinates.phi
         )
 
-        final[:, 0] += displ_3[:, 0] * fac_1
-        final[:, 1] += displ_3[:, 1] * fac_2
-        final[:, 2] += displ_3[:, 2] * fac_1
+        final[:, 0] += displ[:, 4] * fac_1
+        final[:, 1] += displ[:, 5] * fac_2
+        final[:, 2] += displ[:, 6] * fac_1
 
         fac_1 = (mij[1] - mij[2]) * np.cos(2 * coordinates.phi) + 2 * mij[
             5
@@ -233,9 +160,9 @@ class ForwardMergedInstaseisDB(BaseNetCDFInstaseisDB):
             5
         ] * np.cos(2 * coordinates.phi)
 
-        final[:, 0] += displ_4[:, 0] * fac_1
-        final[:, 1] += displ_4[:, 1] * fac_2
-        final[:, 2] += displ_4[:, 2] * fac_1
+        final[:, 0] += displ[:, 7] * fac_1
+        final[:, 1] += displ[:, 8] * fac_2
+        final[:, 2] += displ[:, 9] * fac_1
 
         rotmesh_colat = np.arctan2(coordinates.s, coordinates.z)
 
@@ -22,6 +22,7 @@ instead of
     (http://www.gnu.org/copyleft/lgpl.html)
 """
 from collections import OrderedDict
+import threading
 
 import h5py
 import numpy as np
@@ -43,23 +44,34 @@ class Buffer(object):
         self._buffer = OrderedDict()
         self._hits = 0
         self._fails = 0
+        # Databases and thus their buffers can be used from multiple threads.
+        self._lock = threading.Lock()
 
     def __contains__(self, key):
-        contains = key in self._buffer
-        if contains:
-            self._hits += 1
-        else:
-            self._fails += 1
+        with self._lock:
+            contains = key in self._buffer
+            if contains:
+                self._hits += 1
+            else:
+                self._fails += 1
         return contains
 
-    def get(self, key):
+    def get(self, key, default=None):
         """
         Return an item from the buffer and move it to the end, so it is removed
-        last.
+        last. Returns ``default`` if the item is not in the buffer.
+
+        Use this instead of checking with ``in`` first if the buffer is shared
+        between threads - the item might be removed in between.
         """
-        value = self._buffer.pop(key)
-        self._buffer[key] = value
-        return value
+        with self._lock:
+            try:
+                self._buffer.move_to_end(key)
+            except KeyError:
+                self._fails += 1
+                return default
+            self._hits += 1
+            return self._buffer[key]
 
     def _get_nbytes(self, value):
         # Works with single arrays and iterables of arrays.
@@ -73,14 +85,19 @@ class Buffer(object):
         Add an item to the buffer and make sure that the buffer does not exceed
         the maximum size in memory.
         """
-        self._buffer[key] = value
-        # Assuming value is a numpy array
-        self._total_size += self._get_nbytes(value)
-
-        # Remove existing values, until the size limit is fulfilled.
-        while self._total_size > self._max_size_in_bytes:
-            _, v = self._buffer.popitem(last=False)
-            self._total_size -= self._get_nbytes(v)
+        nbytes = self._get_nbytes(value)
+        with self._lock:
+            # Another thread might have added the same item in the meanwhile.
+            if key in self._buffer:
+                self._total_size -= self._get_nbytes(self._buffer.pop(key))
+            self._buffer[key] = value
+            # Assuming value is a numpy array
+            self._total_size += nbytes
+
+            # Remove existing values, until the size limit is fulfilled.
+            while self._total_size > self._max_size_in_bytes:
+                _, v = self._buffer.popitem(last=False)
+                self._total_size -= self._get_nbytes(v)
 
     def get_size_mb(self):
         return float(self._total_size) / 1024 ** 2
@@ -298,6 +315,19 @@ class Mesh(object):
                 self.G2.transpose(), requirements=["F_CONTIGUOUS"]
             )
 
+            # These only depend on the polynomial order and are shared by
+            # all seismogram extractions - make sure nobody modifies them.
+            for _a in (
+                self.gll_points,
+                self.glj_points,
+                self.G0,
+                self.G1,
+                self.G2,
+                self.G1T,
+                self.G2T,
+            ):
+                _a.flags.writeable = False
+
             # Build a kdtree of the element midpoints.
             self.s_mp = self.f["Mesh"]["mp_mesh_S"]
             self.z_mp = self.f["Mesh"]["mp_mesh_Z"]
@@ -288,7 +288,8 @@ class ReciprocalMergedInstaseisDB(BaseNetCDFInstaseisDB):
         eta,
     ):
         mesh = self.meshes.merged
-        if id_elem not in mesh.strain_buffer:
+        strain = mesh.strain_buffer.get(id_elem)
+        if strain is None:
             utemp = self._get_and_reorder_utemp(id_elem)
 
             strain_fct_map = {
@@ -358,19 +359,20 @@ class ReciprocalMergedInstaseisDB(BaseNetCDFInstaseisDB):
 
             mesh.strain_buffer.add(id_elem, (strain_x, strain_z))
         else:
-            strain_x, strain_z = mesh.strain_buffer.get(id_elem)
+            strain_x, strain_z = strain
+
+        # Both strain fields are interpolated at the same point.
+        weights_xi = spectral_basis.lagrange_weights_1D(col_points_xi, xi)
+        weights_eta = spectral_basis.lagrange_weights_1D(col_points_eta, eta)
 
         all_strains = {}
         for name, strain in (("strain_x", strain_x), ("strain_z", strain_z)):
             if strain is None:
                 all_strains[name] = None
                 continue
-            final_strain = np.empty((strain.shape[0], 6), order="F")
-
-            for i in range(6):
-                final_strain[:, i] = spectral_basis.lagrange_interpol_2D_td(
-                    col_points_xi, col_points_eta, strain[:, :, :, i], xi, eta
-                )
+            final_strain = spectral_basis.lagrange_interpol_2D_td_weights(
+                weights_xi, weights_eta, strain
+            )
 
             if not name == "strain_z":
                 final_strain[:, 3] *= -1.0
@@ -384,32 +386,33 @@ class ReciprocalMergedInstaseisDB(BaseNetCDFInstaseisDB):
         self, id_elem, gll_point_ids, col_points_xi, col_points_eta, xi, eta
     ):
         mesh = self.meshes.merged
-        if id_elem not in mesh.displ_buffer:
+        utemp = mesh.displ_buffer.get(id_elem)
+        if utemp is None:
             utemp = self._get_and_reorder_utemp(id_elem)
             mesh.displ_buffer.add(id_elem, utemp)
-        else:
-            utemp = mesh.displ_buffer.get(id_elem)
-
-        final_displacement_x = np.empty((utemp.shape[0], 3), order="F")
-        utemp_x = utemp[:, :, :, :3]
-        utemp_x = np.require(utemp_x, requirements=["F"], dtype=np.float64)
-        for i in range(3):
-            final_displacement_x[
-                :, i
-            ] = spectral_basis.lagrange_interpol_2D_td(
-                col_points_xi, col_points_eta, utemp_x[:, :, :, i], xi, eta
-            )
 
-        utemp_z = utemp[:, :, :, -3:]
-        utemp_z[:, :, :, 0] = utemp_z[:, :, :, 1]
-        utemp_z[:, :, :, 1][:] = 0
-        utemp_z = np.require(utemp_z, requirements=["F"], dtype=np.float64)
-        final_displacement_z = np.empty((utemp.shape[0], 3), order="F")
-        for i in range(3):
-            final_displacement_z[
-                :, i
-            ] = spectral_basis.lagrange_interpol_2D_td(
-                col_points_xi, col_points_eta, utemp_z[:, :, :, i], xi, eta
-            )
+        weights_xi = spectral_basis.lagrange_weights_1D(col_points_xi, xi)
+        weights_eta = spectral_basis.lagrange_weights_1D(col_points_eta, eta)
+
+        # Interpolate all stored fields at once directly from the layout
+        # they are stored in. Do not modify utemp as it lives in the buffer.
+        displ = spectral_basis.lagrange_interpol_2D_td_weights(
+            weights_xi, weights_eta, utemp
+        )
+
+        # Horizontal fields are available if we have 3 or 5 components.
+        if displ.shape[1] >= 3:
+            final_displacement_x = displ[:, :3]
+        else:
+            final_displacement_x = None
+
+        # Vertical fields are available if we have 2 or 5 components.
+        # Vertical expects disp_s at index 0 and disp_z at index 2.
+        if displ.shape[1] in (2, 5):
+            final_displacement_z = np.zeros((displ.shape[0], 3), order="F")
+            final_displacement_z[:, 0] = displ[:, -2]
+            final_displacement_z[:, 2] = displ[:, -1]
+        else:
+            final_displacement_z = None
 
         return final_displacement_x, final_displacement_z
@@ -11,25 +11,37 @@ AxiSEM's kernel module.
     (http://www.gnu.org/copyleft/lgpl.html)
 """
 import ctypes as C
-import numpy as np
 
-from .helpers import load_lib
+from .helpers import load_lib, require_f64_fortran
 
 
 lib = load_lib()
 
+lib.inside_element.argtypes = [
+    C.c_double,
+    C.c_double,
+    # Plain data pointer, see spectral_basis.py.
+    C.c_void_p,
+    C.c_int,
+    C.c_double,
+    C.POINTER(C.c_bool),
+    C.POINTER(C.c_double),
+    C.POINTER(C.c_double),
+]
+lib.inside_element.restype = None
+
 
 def inside_element(s, z, nodes, element_type, tolerance):
     in_element = C.c_bool(False)
     xi = C.c_double(0.0)
     eta = C.c_double(0.0)
-    nodes = np.require(nodes, requirements=["F_CONTIGUOUS"])
+    nodes = require_f64_fortran(nodes)
     lib.inside_element(
-        C.c_double(s),
-        C.c_double(z),
-        nodes.ctypes.data_as(C.POINTER(C.c_double)),
-        C.c_int(element_type),
-        C.c_double(float(tolerance)),
+        s,
+        z,
+        nodes.ctypes.data,
+        element_type,
+        tolerance,
         C.byref(in_element),
         C.byref(xi),
         C.byref(eta),
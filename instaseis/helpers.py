@@ -13,6 +13,7 @@ import ctypes as C
 import glob
 import inspect
 import math
+import operator
 import os
 
 import numpy as np
@@ -42,6 +43,49 @@ def load_lib():
         return lib
 
 
+def require_f64_fortran(arr):
+    """
+    Same as ``np.require(arr, dtype=np.float64, requirements=["F"])`` but
+    returns arrays that already fulfill this without going through
+    ``np.require()``.
+
+    Most arrays passed to the Fortran routines (mesh properties, buffered
+    element data, collocation points) are already in the correct layout so
+    this is the common case.
+    """
+    if (
+        type(arr) is np.ndarray
+        and arr.dtype == np.float64
+        and arr.flags.f_contiguous
+    ):
+        return arr
+    return np.require(arr, dtype=np.float64, requirements=["F_CONTIGUOUS"])
+
+
+def empty_aligned(shape, dtype=np.float64, order="C", alignment=64):
+    """
+    Same as ``np.empty()`` but the data starts at a multiple of
+    ``alignment`` bytes.
+
+    numpy only guarantees 16 byte alignment. Cache line aligned output
+    arrays allow the compiled kernels to use aligned vector stores and
+    never split a store across two cache lines.
+    """
+    dtype = np.dtype(dtype)
+    if np.ndim(shape) == 0:
+        shape = (operator.index(shape),)
+    else:
+        shape = tuple(operator.index(n) for n in shape)
+    nbytes = dtype.itemsize
+    for n in shape:
+        nbytes *= n
+    buf = np.empty(nbytes + alignment, dtype=np.uint8)
+    start = -buf.__array_interface__["data"][0] % alignment
+    # Slice in two steps: numpy does not advance the data pointer of an
+    # empty slice, which would leave zero-size arrays unaligned.
+    return buf[start:][:nbytes].view(dtype).reshape(shape, order=order)
+
+
 def get_band_code(dt):
     """
     Figure out the channel band code. Done as in SPECFEM.
@@ -174,3 +218,24 @@ def rfftfreq(n, d=1.0):  # pragma: no cover
     N = n // 2 + 1  # NOQA
     results = np.arange(0, N, dtype=int)
     return results * val
+
+
+try:
+    from functools import cached_property
+except ImportError:  # pragma: no cover
+
+    class cached_property(object):  # NOQA
+        """
+        Polyfill for functools.cached_property() for Python < 3.8.
+        """
+
+        def __init__(self, func):
+            self.func = func
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.func.__name__] = value
+            return value
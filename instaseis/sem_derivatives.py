@@ -14,39 +14,60 @@ AxiSEM kernel module.
 import ctypes as C
 import numpy as np
 
-from .helpers import load_lib
+from .helpers import empty_aligned, load_lib, require_f64_fortran
 
 
 lib = load_lib()
 
+# Arrays are passed as plain data pointers, see spectral_basis.py.
+_f64_array = C.c_void_p
+
+for _fct in (
+    lib.strain_monopole_td,
+    lib.strain_dipole_td,
+    lib.strain_quadpole_td,
+):
+    _fct.argtypes = [
+        _f64_array,
+        _f64_array,
+        _f64_array,
+        _f64_array,
+        _f64_array,
+        C.c_int,
+        C.c_int,
+        _f64_array,
+        C.c_int,
+        C.c_bool,
+        _f64_array,
+    ]
+    _fct.restype = None
+
 
 def _strain_td(
     u, G, GT, xi, eta, npol, nsamp, nodes, element_type, axial, fct  # NOQA
 ):
-    strain_tensor = np.zeros(
+    strain_tensor = empty_aligned(
         (nsamp, npol + 1, npol + 1, 6), np.float64, order="F"
     )
-    u = np.require(u, dtype=np.float64, requirements=["F_CONTIGUOUS"])
-    G = np.require(G, dtype=np.float64, requirements=["F_CONTIGUOUS"])  # NOQA
-    GT = np.require(
-        GT, dtype=np.float64, requirements=["F_CONTIGUOUS"]  # NOQA
-    )
-    xi = np.require(xi, dtype=np.float64, requirements=["F_CONTIGUOUS"])
-    eta = np.require(eta, dtype=np.float64, requirements=["F_CONTIGUOUS"])
-    nodes = np.require(nodes, dtype=np.float64, requirements=["F_CONTIGUOUS"])
+    u = require_f64_fortran(u)
+    G = require_f64_fortran(G)  # NOQA
+    GT = require_f64_fortran(GT)  # NOQA
+    xi = require_f64_fortran(xi)
+    eta = require_f64_fortran(eta)
+    nodes = require_f64_fortran(nodes)
 
     fct(
-        u.ctypes.data_as(C.POINTER(C.c_double)),
-        G.ctypes.data_as(C.POINTER(C.c_double)),
-        GT.ctypes.data_as(C.POINTER(C.c_double)),
-        xi.ctypes.data_as(C.POINTER(C.c_double)),
-        eta.ctypes.data_as(C.POINTER(C.c_double)),
-        C.c_int(npol),
-        C.c_int(nsamp),
-        nodes.ctypes.data_as(C.POINTER(C.c_double)),
-        C.c_int(element_type),
-        C.c_bool(axial),
-        strain_tensor.ctypes.data_as(C.POINTER(C.c_double)),
+        u.ctypes.data,
+        G.ctypes.data,
+        GT.ctypes.data,
+        xi.ctypes.data,
+        eta.ctypes.data,
+        npol,
+        nsamp,
+        nodes.ctypes.data,
+        element_type,
+        axial,
+        strain_tensor.ctypes.data,
     )
 
     return strain_tensor
@@ -105,15 +105,9 @@ def _get_finite_source(
     n_derivative = KIND_MAP[units] - STF_MAP[db.info.stf]
     if n_derivative:
         for tr in st:
-            data_summed = {}
-            data_summed["A"] = tr.data
-            _diff_and_integrate(
-                n_derivative=n_derivative,
-                data=data_summed,
-                comp="A",
-                dt_out=tr.stats.delta,
+            tr.data = _diff_and_integrate(
+                n_derivative=n_derivative, data=tr.data, dt_out=tr.stats.delta
             )
-            tr.data = data_summed["A"]
 
     return _validate_and_write_waveforms(
         st=st,
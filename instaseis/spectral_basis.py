@@ -14,40 +14,197 @@ AxiSEM's kernel module.
 import ctypes as C
 import numpy as np
 
-from .helpers import load_lib
+from .helpers import empty_aligned, load_lib, require_f64_fortran
 
 
 lib = load_lib()
 
+# Declare the prototype once so each call is a single C-level call without
+# constructing intermediate ctypes objects for the scalars and pointers.
+# Arrays are passed as plain data pointers - np.ctypeslib.ndpointer() would
+# check them again on every call which costs more than the interpolation of
+# short time series. All arrays are thus required to be Fortran contiguous
+# float64 arrays before being passed to the library.
+_f64_array = C.c_void_p
 
-def lagrange_interpol_2D_td(points1, points2, coefficients, x1, x2):  # NOQA
-    points1 = np.require(
-        points1, dtype=np.float64, requirements=["F_CONTIGUOUS"]
-    )
-    points2 = np.require(
-        points2, dtype=np.float64, requirements=["F_CONTIGUOUS"]
-    )
-    coefficients = np.require(
-        coefficients, dtype=np.float64, requirements=["F_CONTIGUOUS"]
-    )
+lib.lagrange_interpol_2D_td.argtypes = [
+    C.c_int,
+    C.c_int,
+    _f64_array,
+    _f64_array,
+    _f64_array,
+    C.c_double,
+    C.c_double,
+    _f64_array,
+]
+lib.lagrange_interpol_2D_td.restype = None
+
+lib.lagrange_interpol_2D_td_many.argtypes = [
+    C.c_int,
+    C.c_int,
+    C.c_int,
+    _f64_array,
+    _f64_array,
+    _f64_array,
+    _f64_array,
+]
+lib.lagrange_interpol_2D_td_many.restype = None
+
+
+def _check_out(out, shape):
+    """
+    Make sure a user provided output array can directly be written to.
+    """
+    if out.shape != shape:
+        raise ValueError(
+            "Output array has shape %s but %s is required."
+            % (str(out.shape), str(shape))
+        )
+    if out.dtype != np.float64 or not out.flags.f_contiguous:
+        raise ValueError(
+            "Output array must be a Fortran contiguous float64 array."
+        )
+    if not out.flags.writeable:
+        raise ValueError("Output array must be writeable.")
+
+
+def _check_coefficients(coefficients, n, ndim):
+    """
+    Make sure the coefficients match the polynomial order. The library
+    accesses them through a raw pointer and would otherwise read out of
+    bounds.
+    """
+    if coefficients.ndim != ndim or coefficients.shape[1:3] != (n + 1, n + 1):
+        raise ValueError(
+            "Coefficients must have %i dimensions and a spatial shape of "
+            "(%i, %i) but have shape %s."
+            % (ndim, n + 1, n + 1, str(coefficients.shape))
+        )
+
+
+def lagrange_interpol_2D_td(  # NOQA
+    points1, points2, coefficients, x1, x2, out=None
+):
+    """
+    Interpolate time dependent coefficients defined on a tensor product of
+    collocation points at a single point.
+
+    :param out: Optional array of length ``nsamp`` the result is written to.
+        Useful to avoid repeated allocations when called in a loop.
+    """
+    points1 = require_f64_fortran(points1)
+    points2 = require_f64_fortran(points2)
+    coefficients = require_f64_fortran(coefficients)
 
     # Should be safe enough. This was never raised while extracting a lot of
     # seismograms.
     assert len(points1) == len(points2)
 
     n = len(points1) - 1
+    _check_coefficients(coefficients, n, ndim=3)
     nsamp = coefficients.shape[0]
 
-    interpolant = np.zeros(nsamp, dtype="float64", order="F")
+    if out is None:
+        interpolant = empty_aligned(nsamp, dtype=np.float64)
+    else:
+        _check_out(out, (nsamp,))
+        interpolant = out
 
     lib.lagrange_interpol_2D_td(
-        C.c_int(n),
-        C.c_int(nsamp),
-        points1.ctypes.data_as(C.POINTER(C.c_double)),
-        points2.ctypes.data_as(C.POINTER(C.c_double)),
-        coefficients.ctypes.data_as(C.POINTER(C.c_double)),
-        C.c_double(x1),
-        C.c_double(x2),
-        interpolant.ctypes.data_as(C.POINTER(C.c_double)),
+        n,
+        nsamp,
+        points1.ctypes.data,
+        points2.ctypes.data,
+        coefficients.ctypes.data,
+        x1,
+        x2,
+        interpolant.ctypes.data,
+    )
+    return interpolant
+
+
+def lagrange_weights_1D(points, x):  # NOQA
+    """
+    Values of all 1D Lagrange polynomials defined by ``points`` at ``x``.
+
+    These only depend on the evaluation point and can thus be shared by all
+    coefficient sets interpolated at that point.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    numerator = np.empty((len(points), len(points)))
+    numerator[:] = x - points
+    denominator = points[:, np.newaxis] - points[np.newaxis, :]
+    np.fill_diagonal(numerator, 1.0)
+    np.fill_diagonal(denominator, 1.0)
+    return np.prod(numerator / denominator, axis=1)
+
+
+def lagrange_interpol_2D_td_batch(  # NOQA
+    points1, points2, coefficients, x1, x2, out=None
+):
+    """
+    Interpolate multiple sets of time dependent coefficients defined on the
+    same collocation points at a single point.
+
+    :param points1: Collocation points along the first spatial axis.
+    :param points2: Collocation points along the second spatial axis.
+    :param coefficients: Array of shape ``(nsamp, N + 1, N + 1, ncomp)``.
+    :param x1: First coordinate of the evaluation point.
+    :param x2: Second coordinate of the evaluation point.
+    :param out: Optional Fortran ordered array of shape ``(nsamp, ncomp)``
+        the result is written to.
+
+    :returns: Fortran ordered array of shape ``(nsamp, ncomp)``.
+    """
+    assert len(points1) == len(points2)
+
+    return lagrange_interpol_2D_td_weights(
+        lagrange_weights_1D(points1, x1),
+        lagrange_weights_1D(points2, x2),
+        coefficients,
+        out=out,
+    )
+
+
+def lagrange_interpol_2D_td_weights(  # NOQA
+    weights1, weights2, coefficients, out=None
+):
+    """
+    Same as :func:`lagrange_interpol_2D_td_batch` but with the 1D weights
+    of the evaluation point already computed with
+    :func:`lagrange_weights_1D`.
+
+    All sets are interpolated with a single call to the Fortran kernel.
+    The coefficients can be passed in any memory layout, e.g. directly as
+    the view on the data of the merged databases - they are converted to
+    a Fortran ordered double precision array if necessary.
+    """
+    weights1 = require_f64_fortran(weights1)
+    weights2 = require_f64_fortran(weights2)
+    coefficients = require_f64_fortran(coefficients)
+
+    assert len(weights1) == len(weights2)
+
+    n = len(weights1) - 1
+    _check_coefficients(coefficients, n, ndim=4)
+    nsamp = coefficients.shape[0]
+    ncomp = coefficients.shape[-1]
+
+    if out is None:
+        interpolant = empty_aligned(
+            (nsamp, ncomp), dtype=np.float64, order="F"
+        )
+    else:
+        _check_out(out, (nsamp, ncomp))
+        interpolant = out
+
+    lib.lagrange_interpol_2D_td_many(
+        n,
+        nsamp,
+        ncomp,
+        weights1.ctypes.data,
+        weights2.ctypes.data,
+        coefficients.ctypes.data,
+        interpolant.ctypes.data,
     )
     return interpolant
@@ -299,6 +299,17 @@ pure function mxm_atd(a, b)
   real(kind=dp)              :: mxm_atd(1:size(a,1), 0:size(a,2)-1,0:size(b,2)-1)  !< Result
   integer                    :: i, j, k
 
+  if (size(a,3) == 5) then
+     ! npol = 4, unrolled to compute each column in a single pass
+     do j = 0, size(b,2) -1
+        do i = 0, size(a,2) -1
+           mxm_atd(:,i,j) = a(:,i,0) * b(0,j) + a(:,i,1) * b(1,j) + a(:,i,2) * b(2,j) &
+                          + a(:,i,3) * b(3,j) + a(:,i,4) * b(4,j)
+        end do
+     end do
+     return
+  endif
+
   mxm_atd = 0
 
   do j = 0, size(b,2) -1
@@ -321,6 +332,17 @@ pure function mxm_btd(a, b)
   real(kind=dp)              :: mxm_btd(1:size(b,1),0:size(a,1)-1,0:size(b,2)-1)  !< Result
   integer                    :: i, j, k
 
+  if (size(a,2) == 5) then
+     ! npol = 4, unrolled to compute each column in a single pass
+     do j = 0, size(b,2) -1
+        do i = 0, size(a,1) -1
+           mxm_btd(:,i,j) = a(i,0) * b(:,0,j) + a(i,1) * b(:,1,j) + a(i,2) * b(:,2,j) &
+                          + a(i,3) * b(:,3,j) + a(i,4) * b(:,4,j)
+        end do
+     end do
+     return
+  endif
+
   mxm_btd = 0
 
   do j = 0, size(b,2) -1
@@ -343,9 +365,19 @@ pure function mxm_ipol0_atd(a, b)
   real(kind=dp)              :: mxm_ipol0_atd(1:size(a,1), 0:size(b,2)-1)  !< Result
   integer                    :: i, j, k
 
-  mxm_ipol0_atd = 0
   i = 0
 
+  if (size(a,3) == 5) then
+     ! npol = 4, unrolled to compute each column in a single pass
+     do j = 0, size(b,2) -1
+        mxm_ipol0_atd(:,j) = a(:,i,0) * b(0,j) + a(:,i,1) * b(1,j) + a(:,i,2) * b(2,j) &
+                           + a(:,i,3) * b(3,j) + a(:,i,4) * b(4,j)
+     end do
+     return
+  endif
+
+  mxm_ipol0_atd = 0
+
   do j = 0, size(b,2) -1
      do k = 0, size(a,3) -1
         mxm_ipol0_atd(:,j) = mxm_ipol0_atd(:,j) + a(:,i,k) * b(k,j)
@@ -364,9 +396,19 @@ pure function mxm_ipol0_btd(a, b)
   real(kind=dp)              :: mxm_ipol0_btd(1:size(b,1),0:size(b,2)-1)  !< Result
   integer                    :: i, j, k
 
+  i = 0
+
+  if (size(a,2) == 5) then
+     ! npol = 4, unrolled to compute each column in a single pass
+     do j = 0, size(b,2) -1
+        mxm_ipol0_btd(:,j) = a(i,0) * b(:,0,j) + a(i,1) * b(:,1,j) + a(i,2) * b(:,2,j) &
+                           + a(i,3) * b(:,3,j) + a(i,4) * b(:,4,j)
+     end do
+     return
+  endif
+
   mxm_ipol0_btd = 0
 
-  i = 0
   do j = 0, size(b,2) -1
      do k = 0, size(a,2) -1
         mxm_ipol0_btd(:,j) = mxm_ipol0_btd(:,j) + a(i,k) * b(:,k,j)
@@ -30,7 +30,27 @@ subroutine lagrange_interpol_2D_td_wrapped(N, nsamp, points1, points2, coefficie
   real(c_double), intent(in), value  :: x1, x2
   real(c_double), intent(out)        :: interpolant(nsamp)
 
-  interpolant = lagrange_interpol_2D_td(points1, points2, coefficients, x1, x2)
+  call lagrange_interpol_2D_td_inplace(points1, points2, coefficients, x1, x2, &
+                                       interpolant)
+end subroutine
+!-----------------------------------------------------------------------------------------
+
+!-----------------------------------------------------------------------------------------
+subroutine lagrange_interpol_2D_td_many_wrapped(N, nsamp, ncomp, weights1, weights2, &
+                                                coefficients, interpolant) &
+  bind(c, name="lagrange_interpol_2D_td_many")
+
+  integer(c_int), intent(in), value  :: N, nsamp, ncomp
+  real(c_double), intent(in)         :: weights1(0:N), weights2(0:N)
+  real(c_double), intent(in)         :: coefficients(1:nsamp, 0:N, 0:N, ncomp)
+  real(c_double), intent(out)        :: interpolant(nsamp, ncomp)
+
+  integer                            :: k
+
+  do k=1, ncomp
+     call lagrange_interpol_2D_td_weights(weights1, weights2, coefficients(:,:,:,k), &
+                                          interpolant(:,k))
+  enddo
 end subroutine
 !-----------------------------------------------------------------------------------------
 
@@ -46,6 +66,24 @@ function lagrange_interpol_2D_td(points1, points2, coefficients, x1, x2)
   real(dp), intent(in)  :: coefficients(:,0:,0:)
   real(dp), intent(in)  :: x1, x2
   real(dp)              :: lagrange_interpol_2D_td(size(coefficients,1))
+
+  call lagrange_interpol_2D_td_inplace(points1, points2, coefficients, x1, x2, &
+                                       lagrange_interpol_2D_td)
+
+end function lagrange_interpol_2D_td
+!-----------------------------------------------------------------------------------------
+
+!-----------------------------------------------------------------------------------------
+!> same as lagrange_interpol_2D_td, but writes the result to interpolant to avoid a
+!  temporary array. The weights of the tensorproduct are computed once per point pair so
+!  the loop over the samples is a plain contiguous multiply-add.
+subroutine lagrange_interpol_2D_td_inplace(points1, points2, coefficients, x1, x2, &
+                                           interpolant)
+
+  real(dp), intent(in)  :: points1(0:), points2(0:)
+  real(dp), intent(in)  :: coefficients(:,0:,0:)
+  real(dp), intent(in)  :: x1, x2
+  real(dp), intent(out) :: interpolant(:)
   real(dp)              :: l_i(0:size(points1)-1), l_j(0:size(points2)-1)
 
   integer               :: i, j, m1, m2, n1, n2
@@ -69,16 +107,60 @@ function lagrange_interpol_2D_td(points1, points2, coefficients, x1, x2)
      enddo
   enddo
 
-  lagrange_interpol_2D_td(:) = 0
+  call lagrange_interpol_2D_td_weights(l_i, l_j, coefficients, interpolant)
 
-  do i=0, n1
+end subroutine lagrange_interpol_2D_td_inplace
+!-----------------------------------------------------------------------------------------
+
+!-----------------------------------------------------------------------------------------
+!> same as lagrange_interpol_2D_td_inplace, but with the values of the 1D Lagrange
+!  polynomials at the interpolation point (l_i and l_j above) already computed, so they
+!  can be shared by all coefficient sets interpolated at that point.
+subroutine lagrange_interpol_2D_td_weights(weights1, weights2, coefficients, interpolant)
+
+  real(dp), intent(in)  :: weights1(0:), weights2(0:)
+  real(dp), intent(in)  :: coefficients(:,0:,0:)
+  real(dp), intent(out) :: interpolant(:)
+  real(dp)              :: w
+
+  ! the samples are processed in blocks so the part of interpolant that is summed into
+  ! stays in the L1 cache for all (N + 1)**2 contributions
+  integer, parameter    :: block_size = 512
+  integer               :: i, j, n1, n2, t0, t1
+
+  n1 = size(weights1) - 1
+  n2 = size(weights2) - 1
+
+  do t0=1, size(interpolant), block_size
+     t1 = min(t0 + block_size - 1, size(interpolant))
+
+     interpolant(t0:t1) = 0
+
+     if (n1 == 4 .and. n2 == 4) then
+        ! default polynomial order of AxiSEM: unrolled inner loop, so each column of
+        ! the element is added in a single pass over the samples. The summation order
+        ! is the same as in the general case below.
+        do j=0, 4
+           interpolant(t0:t1) = interpolant(t0:t1) &
+                              + (weights1(0) * weights2(j)) * coefficients(t0:t1,0,j) &
+                              + (weights1(1) * weights2(j)) * coefficients(t0:t1,1,j) &
+                              + (weights1(2) * weights2(j)) * coefficients(t0:t1,2,j) &
+                              + (weights1(3) * weights2(j)) * coefficients(t0:t1,3,j) &
+                              + (weights1(4) * weights2(j)) * coefficients(t0:t1,4,j)
+        enddo
+        cycle
+     endif
+
+     ! j outermost to traverse the coefficients in memory order
      do j=0, n2
-        lagrange_interpol_2D_td(:) = lagrange_interpol_2D_td(:) &
-                                     + coefficients(:,i,j) * l_i(i) * l_j(j)
+        do i=0, n1
+           w = weights1(i) * weights2(j)
+           interpolant(t0:t1) = interpolant(t0:t1) + w * coefficients(t0:t1,i,j)
+        enddo
      enddo
   enddo
 
-end function lagrange_interpol_2D_td
+end subroutine lagrange_interpol_2D_td_weights
 !-----------------------------------------------------------------------------------------
 
 end module
@@ -40,3 +40,41 @@ def test_buffer():
     # Once more not in.
     assert "d" not in buf
     assert buf.efficiency == 2.0 / 4.0
+
+
+def test_buffer_get():
+    buf = Buffer(max_size_in_mb=1.0)
+    value = np.empty(2, dtype=np.int8)
+    buf.add("a", value)
+
+    assert buf.get("a") is value
+    assert buf.get("b") is None
+    assert buf.get("b", default=1) == 1
+    assert buf.efficiency == 1.0 / 3.0
+
+    # Adding an item twice does not count its size twice.
+    buf.add("a", value)
+    assert buf._total_size == 2
+
+
+def test_buffer_threads():
+    """
+    Concurrent lookups with items being evicted at the same time.
+    """
+    import concurrent.futures
+
+    # Room for only a few items at a time.
+    buf = Buffer(max_size_in_mb=4 * 1024 / 1024 ** 2)
+
+    def _work(offset):
+        for i in range(2000):
+            key = (i + offset) % 10
+            if buf.get(key) is None:
+                buf.add(key, np.empty(1024, dtype=np.int8))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [executor.submit(_work, i) for i in range(8)]:
+            future.result()
+
+    assert len(buf._buffer) <= 4
+    assert buf._total_size == 1024 * len(buf._buffer)
@@ -9,7 +9,9 @@ Tests for some helper routines.
     GNU Lesser General Public License, Version 3 [non-commercial/academic use]
     (http://www.gnu.org/copyleft/lgpl.html)
 """
-from instaseis.helpers import io_chunker
+import numpy as np
+
+from instaseis.helpers import empty_aligned, io_chunker, require_f64_fortran
 
 
 def test_io_chunker():
@@ -27,3 +29,45 @@ def test_io_chunker():
     # A couple more complex cases.
     assert io_chunker([0, 1, 2, 4, 6, 7, 8]) == [[0, 3], 4, [6, 9]]
     assert io_chunker([0, 2, 4, 6, 7, 8, 10]) == [0, 2, 4, [6, 9], 10]
+
+
+def test_require_f64_fortran():
+    # Arrays already fulfilling the requirements are returned as is.
+    a = np.zeros((4, 3), dtype=np.float64, order="F")
+    assert require_f64_fortran(a) is a
+
+    # Everything else is converted.
+    for b in [
+        np.zeros((4, 3), dtype=np.float64, order="C"),
+        np.zeros((4, 3), dtype=np.float32, order="F"),
+        np.zeros((4, 6), dtype=np.float64, order="F")[:, ::2],
+        [[0.0, 1.0], [2.0, 3.0]],
+    ]:
+        c = require_f64_fortran(b)
+        assert c is not b
+        assert c.dtype == np.float64
+        assert c.flags.f_contiguous
+        np.testing.assert_array_equal(c, b)
+
+
+def test_empty_aligned():
+    for shape, order in [(17, "C"), ((7, 3), "F"), ((5, 5, 2), "C"), (0, "C")]:
+        a = empty_aligned(shape, dtype=np.float64, order=order)
+        assert a.ctypes.data % 64 == 0
+        assert a.dtype == np.float64
+        assert a.shape == np.empty(shape).shape
+        assert a.flags.writeable
+        if order == "F":
+            assert a.flags.f_contiguous
+        else:
+            assert a.flags.c_contiguous
+
+    a = empty_aligned(10, dtype=np.float32, alignment=128)
+    assert a.ctypes.data % 128 == 0
+    assert a.dtype == np.float32
+
+    # numpy integers are valid shapes as well.
+    for shape in [np.int64(5), (np.int32(3), np.int64(2))]:
+        a = empty_aligned(shape)
+        assert a.ctypes.data % 64 == 0
+        assert a.shape == np.empty(shape).shape
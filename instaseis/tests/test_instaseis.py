@@ -23,7 +23,12 @@ import instaseis
 from instaseis import InstaseisError, InstaseisNotFoundError
 from instaseis.database_interfaces import find_and_open_files
 from instaseis.database_interfaces.base_instaseis_db import (
+    DEFAULT_MU,
+    STF_MAP,
+    _cumtrapz,
     _get_seismogram_times,
+    _gradient,
+    _phase_ramp,
 )
 from instaseis import Source, Receiver, ForceSource, FiniteSource
 from instaseis.helpers import (
@@ -785,6 +790,17 @@ def test_incremental_bwd_force_source(db):
         atol=1e-12,
     )
 
+    # Extracting again must not change anything, e.g. by modifying the
+    # buffered data.
+    st_bwd_2 = instaseis_bwd.get_seismograms(
+        source=source,
+        receiver=receiver,
+        components=("Z", "N", "E", "R", "T"),
+        kind="velocity",
+    )
+    for tr, tr_2 in zip(st_bwd, st_bwd_2):
+        np.testing.assert_array_equal(tr.data, tr_2.data)
+
     # Force source does not work with strain databases.
     db_strain = find_and_open_files(
         os.path.join(DATA, "100s_db_bwd_strain_only")
@@ -1024,33 +1040,10 @@ def test_finite_source(bwd_db):
         kernelwidth=1,
     )
 
+    # All traces have the same length so they can be compared at once.
     np.testing.assert_allclose(
-        st_fin.select(component="Z")[0].data,
-        st_ref.select(component="Z")[0].data,
-        rtol=1e-7,
-        atol=1e-12,
-    )
-    np.testing.assert_allclose(
-        st_fin.select(component="N")[0].data,
-        st_ref.select(component="N")[0].data,
-        rtol=1e-7,
-        atol=1e-12,
-    )
-    np.testing.assert_allclose(
-        st_fin.select(component="E")[0].data,
-        st_ref.select(component="E")[0].data,
-        rtol=1e-7,
-        atol=1e-12,
-    )
-    np.testing.assert_allclose(
-        st_fin.select(component="R")[0].data,
-        st_ref.select(component="R")[0].data,
-        rtol=1e-7,
-        atol=1e-12,
-    )
-    np.testing.assert_allclose(
-        st_fin.select(component="T")[0].data,
-        st_ref.select(component="T")[0].data,
+        np.array([st_fin.select(component=c)[0].data for c in "ZNERT"]),
+        np.array([st_ref.select(component=c)[0].data for c in "ZNERT"]),
         rtol=1e-7,
         atol=1e-12,
     )
@@ -1091,6 +1084,35 @@ def test_finite_source(bwd_db):
         sources=[source], receiver=receiver, components=("Z"), correct_mu=True
     )
     assert st != st_2
+    mu = instaseis_bwd.get_seismograms(
+        source=source, receiver=receiver, return_obspy_stream=False
+    )["mu"]
+    np.testing.assert_allclose(st_2[0].data, st[0].data * mu / DEFAULT_MU)
+
+    # The parallel extraction must not change the results.
+    sources = [source] * 5
+    st_serial = instaseis_bwd.get_seismograms_finite_source(
+        sources=sources, receiver=receiver, max_workers=1
+    )
+    st_parallel = instaseis_bwd.get_seismograms_finite_source(
+        sources=sources, receiver=receiver, max_workers=4
+    )
+    assert st_serial == st_parallel
+
+    # More sources than are summed at once.
+    st_many = instaseis_bwd.get_seismograms_finite_source(
+        sources=[source] * 70, receiver=receiver, correct_mu=True
+    )
+    for tr_many, tr in zip(st_many, st_2):
+        np.testing.assert_allclose(tr_many.data, 70 * tr.data, rtol=1e-10)
+
+    # The resampling must only depend on the summed traces.
+    st_empty = instaseis_bwd.get_seismograms_finite_source(
+        sources=[], receiver=receiver, dt=dt, kernelwidth=1
+    )
+    for tr_empty, tr in zip(st_empty, st_fin):
+        assert tr_empty.stats.npts == tr.stats.npts
+        assert not tr_empty.data.any()
 
 
 def test_get_band_code_method():
@@ -1223,8 +1245,8 @@ def test_higher_level_event_and_receiver_parsing(bwd_db):
 
 
 @pytest.mark.parametrize("db", DBS)
-def test_available_components_decorator(db):
-    db = find_and_open_files(db)
+def test_available_components_decorator(db, open_cached_db):
+    db = open_cached_db(db)
     if "vertical" in db.info.components and "horizontal" in db.info.components:
         assert db.available_components == ["Z", "N", "E", "R", "T"]
     elif "4 elemental moment tensors" in db.info.components:
@@ -2278,11 +2300,11 @@ def test_merged_forward_database_layout():
 
 
 @pytest.mark.parametrize("bwd_db", BW_DISPL_DBS)
-def test_error_handling_source_too_deep(bwd_db):
+def test_error_handling_source_too_deep(bwd_db, open_cached_db):
     """
     Tests the error handling if the source is too deep.
     """
-    db = find_and_open_files(bwd_db)
+    db = open_cached_db(bwd_db)
     # 900 km is deeper than any test database.
     src = Source(
         latitude=4.0,
@@ -2308,11 +2330,11 @@ def test_error_handling_source_too_deep(bwd_db):
 
 
 @pytest.mark.parametrize("bwd_db", BW_DISPL_DBS)
-def test_error_handling_source_too_shallow(bwd_db):
+def test_error_handling_source_too_shallow(bwd_db, open_cached_db):
     """
     Tests the error handling if the source is too shallow.
     """
-    db = find_and_open_files(bwd_db)
+    db = open_cached_db(bwd_db)
     src = Source(
         latitude=4.0,
         longitude=3.0,
@@ -2417,12 +2439,12 @@ def test_epicentral_distance_not_in_db(bwd_db):
 
 
 @pytest.mark.parametrize("bwd_db", BW_DISPL_DBS)
-def test_source_depth_greens_function_error_handling(bwd_db):
+def test_source_depth_greens_function_error_handling(bwd_db, open_cached_db):
     """
     Tests the error handling for the greens functions for too deep or too
     shallow sources.
     """
-    db = find_and_open_files(bwd_db)
+    db = open_cached_db(bwd_db)
 
     # all good.
     db.get_greens_function(
@@ -2461,11 +2483,11 @@ def test_source_depth_greens_function_error_handling(bwd_db):
 
 
 @pytest.mark.parametrize("bwd_db", BW_DISPL_DBS)
-def test_dt_must_be_larger_than_zero(bwd_db):
+def test_dt_must_be_larger_than_zero(bwd_db, open_cached_db):
     """
     dt must be larger than zero!
     """
-    db = find_and_open_files(bwd_db)
+    db = open_cached_db(bwd_db)
 
     src = Source(
         latitude=4.0,
@@ -2507,11 +2529,11 @@ def test_dt_must_be_larger_than_zero(bwd_db):
 
 
 @pytest.mark.parametrize("bwd_db", BW_DISPL_DBS)
-def test_no_downsampling(bwd_db):
+def test_no_downsampling(bwd_db, open_cached_db):
     """
     Make sure downsampling is not possible.
     """
-    db = find_and_open_files(bwd_db)
+    db = open_cached_db(bwd_db)
 
     src = Source(
         latitude=4.0,
@@ -2572,11 +2594,13 @@ def test_no_downsampling(bwd_db):
 
 
 @pytest.mark.parametrize("db", BW_DISPL_DBS)
-def test_exception_when_using_a_finite_source_instead_of_a_normal_source(db):
+def test_exception_when_using_a_finite_source_instead_of_a_normal_source(
+    db, open_cached_db
+):
     """
     Tests that a sensible error message is raised.
     """
-    db = find_and_open_files(db)
+    db = open_cached_db(db)
     src = FiniteSource()
     rec = Receiver(latitude=10.0, longitude=20.0)
 
@@ -2587,3 +2611,127 @@ def test_exception_when_using_a_finite_source_instead_of_a_normal_source(db):
         "Please use the `get_seismograms_finite_source()` method to compute "
         "seisomgrams with finite sources."
     )
+
+
+def test_phase_ramp():
+    """
+    The phase ramp must shift a signal by the given time.
+    """
+    nfft, dt = 64, 0.5
+    data = np.zeros(nfft)
+    data[10] = 1.0
+
+    ramp = _phase_ramp(nfft, 2.0, dt)
+    shifted = np.fft.irfft(np.fft.rfft(data) * ramp, n=nfft)
+    expected = np.zeros(nfft)
+    expected[14] = 1.0
+    np.testing.assert_allclose(shifted, expected, atol=1e-12)
+
+
+def test_gradient():
+    """
+    Must be identical to numpy's implementation for a scalar spacing.
+    """
+    data = np.random.RandomState(12345).randn(3, 100)
+    for dx in (1.0, 0.25, 13.7):
+        np.testing.assert_array_equal(
+            _gradient(data, dx), np.gradient(data, dx, axis=-1)
+        )
+        np.testing.assert_array_equal(
+            _gradient(data[1], dx), np.gradient(data[1], dx)
+        )
+
+
+def test_cumtrapz():
+    """
+    Must be identical to scipy's implementation.
+    """
+    try:
+        from scipy.integrate import cumulative_trapezoid as cumtrapz
+    except ImportError:  # pragma: no cover
+        from scipy.integrate import cumtrapz
+
+    data = np.random.RandomState(12345).randn(3, 100)
+    for dx in (1.0, 0.25, 13.7):
+        np.testing.assert_array_equal(
+            _cumtrapz(data, dx),
+            cumtrapz(data, dx=dx, initial=0.0, axis=-1),
+        )
+        np.testing.assert_array_equal(
+            _cumtrapz(data[1], dx), cumtrapz(data[1], dx=dx, initial=0.0)
+        )
+
+
+@pytest.mark.parametrize("db", DBS)
+def test_reconvolve_database_stf(db):
+    """
+    Reconvolving the source time function of the database itself skips the
+    spectral division but must give the same results.
+    """
+    db = find_and_open_files(db)
+    receiver = Receiver(latitude=42.6390, longitude=74.4940)
+    stf = {0: db.info.sliprate, 1: db.info.slip}[STF_MAP[db.info.stf]]
+
+    source = Source(
+        latitude=89.91, longitude=0.0, depth_in_m=12000, m_rr=4.71e17
+    )
+    source.set_sliprate(stf, db.info.dt, normalize=False)
+    assert db._is_database_stf(source.sliprate)
+    # The spectra must be computed in double precision even though the
+    # source time functions are stored in single precision.
+    assert db._stf_deconv_f.dtype == np.complex128
+    st = db.get_seismograms(
+        source=source,
+        receiver=receiver,
+        reconvolve_stf=True,
+        remove_source_shift=False,
+    )
+
+    # Same spectrum but it no longer is identical to the database's stf.
+    source.set_sliprate(np.append(stf, 0.0), db.info.dt, normalize=False)
+    assert not db._is_database_stf(source.sliprate)
+    st_2 = db.get_seismograms(
+        source=source,
+        receiver=receiver,
+        reconvolve_stf=True,
+        remove_source_shift=False,
+    )
+
+    for tr, tr_2 in zip(st, st_2):
+        np.testing.assert_allclose(
+            tr.data, tr_2.data, rtol=1e-7, atol=1e-7 * np.abs(tr.data).max()
+        )
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_finite_source_memory_does_not_grow_with_sources(max_workers):
+    """
+    The point sources are summed while they are extracted so the memory
+    usage must not depend on the number of sources.
+    """
+    import tracemalloc
+
+    db = find_and_open_files(os.path.join(DATA, "100s_db_bwd_displ_only"))
+    receiver = Receiver(latitude=42.6390, longitude=74.4940)
+    source = Source(
+        latitude=89.91, longitude=0.0, depth_in_m=12000, m_rr=4.71e17
+    )
+    source.set_sliprate(
+        db.info.sliprate, db.info.dt, time_shift=1.0, normalize=False
+    )
+
+    peaks = []
+    for count in (50, 400):
+        tracemalloc.start()
+        try:
+            db.get_seismograms_finite_source(
+                sources=[source] * count,
+                receiver=receiver,
+                max_workers=max_workers,
+            )
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    # Keeping all extracted seismograms alive would require several MB here.
+    assert peaks[1] < 2 * peaks[0]
@@ -10,9 +10,10 @@ Mostly testing the various wrappers.
     (http://www.gnu.org/copyleft/lgpl.html)
 """
 import numpy as np
+import pytest
 
 
-from instaseis import finite_elem_mapping, rotations
+from instaseis import finite_elem_mapping, rotations, spectral_basis
 
 
 def test_rotate_frame_rd():
@@ -214,3 +215,264 @@ def test_inside_element():
         xi_ref=-0.7846998127497518,
         eta_ref=-0.8109601156061497,
     )
+
+
+# GLL and GLJ points for a polynomial order of 4.
+GLL_POINTS = np.array(
+    [-1.0, -np.sqrt(3.0 / 7.0), 0.0, np.sqrt(3.0 / 7.0), 1.0]
+)
+GLJ_POINTS = np.array(
+    [-1.0, -0.5077876295583007, 0.13230082077838155, 0.7088533421465525, 1.0]
+)
+
+
+def test_lagrange_interpol_2D_td():  # NOQA
+    np.random.seed(12345)
+    coefficients = np.require(
+        np.random.random((20, 5, 5)), requirements=["F_CONTIGUOUS"]
+    )
+
+    # Exact at the collocation points.
+    for i in range(5):
+        for j in range(5):
+            np.testing.assert_allclose(
+                spectral_basis.lagrange_interpol_2D_td(
+                    GLJ_POINTS,
+                    GLL_POINTS,
+                    coefficients,
+                    GLJ_POINTS[i],
+                    GLL_POINTS[j],
+                ),
+                coefficients[:, i, j],
+                rtol=1e-12,
+                atol=1e-12,
+            )
+
+    # Polynomials up to the order of the basis are reproduced exactly.
+    s = np.linspace(0.5, 2.0, 20)
+    coefficients = np.empty((20, 5, 5), order="F")
+    for i in range(5):
+        for j in range(5):
+            coefficients[:, i, j] = (
+                s * GLJ_POINTS[i] ** 3 * GLL_POINTS[j] ** 4 - GLJ_POINTS[i]
+            )
+    x1, x2 = 0.3, -0.7
+    np.testing.assert_allclose(
+        spectral_basis.lagrange_interpol_2D_td(
+            GLJ_POINTS, GLL_POINTS, coefficients, x1, x2
+        ),
+        s * x1 ** 3 * x2 ** 4 - x1,
+        rtol=1e-12,
+        atol=1e-12,
+    )
+
+    # Same for other polynomial orders which use a different code path.
+    points = np.array([-1.0, -1.0 / np.sqrt(5.0), 1.0 / np.sqrt(5.0), 1.0])
+    coefficients = np.empty((20, 4, 4), order="F")
+    for i in range(4):
+        for j in range(4):
+            coefficients[:, i, j] = s * points[i] ** 2 * points[j] ** 3
+    np.testing.assert_allclose(
+        spectral_basis.lagrange_interpol_2D_td(
+            points, points, coefficients, x1, x2
+        ),
+        s * x1 ** 2 * x2 ** 3,
+        rtol=1e-12,
+        atol=1e-12,
+    )
+
+
+def test_lagrange_interpol_2D_td_batch():  # NOQA
+    np.random.seed(12345)
+    coefficients = np.require(
+        np.random.random((20, 5, 5, 3)), requirements=["F_CONTIGUOUS"]
+    )
+
+    for x1, x2 in [(0.3, -0.7), (-1.0, 1.0), (GLJ_POINTS[2], 0.1)]:
+        interpolant = spectral_basis.lagrange_interpol_2D_td_batch(
+            GLJ_POINTS, GLL_POINTS, coefficients, x1, x2
+        )
+        assert interpolant.shape == (20, 3)
+        for i in range(3):
+            np.testing.assert_allclose(
+                interpolant[:, i],
+                spectral_basis.lagrange_interpol_2D_td(
+                    GLJ_POINTS, GLL_POINTS, coefficients[:, :, :, i], x1, x2
+                ),
+                rtol=1e-12,
+                atol=1e-12,
+            )
+
+
+def test_lagrange_interpol_2D_td_coefficient_shapes():  # NOQA
+    """
+    Coefficients not matching the collocation points must raise instead of
+    being read out of bounds by the library.
+    """
+    np.random.seed(12345)
+    coefficients = np.require(
+        np.random.random((20, 5, 5, 3)), requirements=["F_CONTIGUOUS"]
+    )
+
+    # The 3D coefficients of a single set passed to the batched version.
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td_batch(
+            GLJ_POINTS, GLL_POINTS, coefficients[:, :, :, 0], 0.3, -0.7
+        )
+    assert "4 dimensions" in str(err.value)
+
+    # Spatial extent too small for the weights.
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td_weights(
+            np.ones(5), np.ones(5), coefficients[:, :4, :4]
+        )
+    assert "(5, 5)" in str(err.value)
+
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td(
+            GLJ_POINTS, GLL_POINTS, coefficients, 0.3, -0.7
+        )
+    assert "3 dimensions" in str(err.value)
+
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td(
+            GLJ_POINTS, GLL_POINTS, coefficients[:, :4, :, 0], 0.3, -0.7
+        )
+    assert "(5, 5)" in str(err.value)
+
+
+def test_lagrange_interpol_2D_td_output_buffer():  # NOQA
+    np.random.seed(12345)
+    coefficients = np.require(
+        np.random.random((20, 5, 5, 3)), requirements=["F_CONTIGUOUS"]
+    )
+
+    out = np.empty(20)
+    result = spectral_basis.lagrange_interpol_2D_td(
+        GLJ_POINTS, GLL_POINTS, coefficients[:, :, :, 0], 0.3, -0.7, out=out
+    )
+    assert result is out
+    np.testing.assert_allclose(
+        out,
+        spectral_basis.lagrange_interpol_2D_td(
+            GLJ_POINTS, GLL_POINTS, coefficients[:, :, :, 0], 0.3, -0.7
+        ),
+    )
+
+    out = np.empty((20, 3), order="F")
+    result = spectral_basis.lagrange_interpol_2D_td_batch(
+        GLJ_POINTS, GLL_POINTS, coefficients, 0.3, -0.7, out=out
+    )
+    assert result is out
+    np.testing.assert_allclose(
+        out,
+        spectral_basis.lagrange_interpol_2D_td_batch(
+            GLJ_POINTS, GLL_POINTS, coefficients, 0.3, -0.7
+        ),
+    )
+
+    # Wrong shapes or memory layouts are not silently accepted.
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td(
+            GLJ_POINTS,
+            GLL_POINTS,
+            coefficients[:, :, :, 0],
+            0.3,
+            -0.7,
+            out=np.empty(19),
+        )
+    assert "shape" in str(err.value)
+
+    with pytest.raises(ValueError) as err:
+        spectral_basis.lagrange_interpol_2D_td_batch(
+            GLJ_POINTS,
+            GLL_POINTS,
+            coefficients,
+            0.3,
+            -0.7,
+            out=np.empty((20, 3), order="C"),
+        )
+    assert "Fortran contiguous" in str(err.value)
+
+
+def test_lagrange_weights_1D():  # NOQA
+    # Kronecker delta at the collocation points.
+    for i, x in enumerate(GLL_POINTS):
+        weights = spectral_basis.lagrange_weights_1D(GLL_POINTS, x)
+        expected = np.zeros(5)
+        expected[i] = 1.0
+        np.testing.assert_allclose(weights, expected, atol=1e-15)
+
+    # Partition of unity everywhere else.
+    for x in np.linspace(-1.0, 1.0, 7):
+        np.testing.assert_allclose(
+            spectral_basis.lagrange_weights_1D(GLJ_POINTS, x).sum(), 1.0
+        )
+
+    np.random.seed(12345)
+    coefficients = np.require(
+        np.random.random((20, 5, 5, 3)), requirements=["F_CONTIGUOUS"]
+    )
+    np.testing.assert_allclose(
+        spectral_basis.lagrange_interpol_2D_td_weights(
+            spectral_basis.lagrange_weights_1D(GLJ_POINTS, 0.3),
+            spectral_basis.lagrange_weights_1D(GLL_POINTS, -0.7),
+            coefficients,
+        ),
+        spectral_basis.lagrange_interpol_2D_td_batch(
+            GLJ_POINTS, GLL_POINTS, coefficients, 0.3, -0.7
+        ),
+    )
+
+
+def test_lagrange_interpol_2D_td_weights_c_order():  # NOQA
+    """
+    The merged databases store the time axis last in C order - make sure
+    this layout can directly be passed.
+    """
+    np.random.seed(12345)
+    c_order = np.random.random((3, 5, 5, 20)).astype(np.float32)
+    # Same view as produced for the merged databases.
+    coefficients = np.rollaxis(c_order, 3, 0)
+    coefficients = np.rollaxis(coefficients, 2, 1)
+    coefficients = np.rollaxis(coefficients, 3, 2)
+    assert coefficients.shape == (20, 5, 5, 3)
+    assert not coefficients.flags.f_contiguous
+
+    weights1 = spectral_basis.lagrange_weights_1D(GLJ_POINTS, 0.3)
+    weights2 = spectral_basis.lagrange_weights_1D(GLL_POINTS, -0.7)
+
+    np.testing.assert_allclose(
+        spectral_basis.lagrange_interpol_2D_td_weights(
+            weights1, weights2, coefficients
+        ),
+        spectral_basis.lagrange_interpol_2D_td_weights(
+            weights1,
+            weights2,
+            np.require(
+                coefficients, dtype=np.float64, requirements=["F_CONTIGUOUS"]
+            ),
+        ),
+    )
+
+
+def test_lagrange_interpol_2D_td_weights_many_samples():  # NOQA
+    """
+    Long time series are processed in blocks - make sure this works for
+    any number of samples.
+    """
+    np.random.seed(12345)
+    for npol, nsamp in [(4, 1100), (4, 512), (3, 1025)]:
+        coefficients = np.require(
+            np.random.random((nsamp, npol + 1, npol + 1, 2)),
+            requirements=["F_CONTIGUOUS"],
+        )
+        weights1 = np.random.random(npol + 1)
+        weights2 = np.random.random(npol + 1)
+        np.testing.assert_allclose(
+            spectral_basis.lagrange_interpol_2D_td_weights(
+                weights1, weights2, coefficients
+            ),
+            np.einsum("tijc,i,j->tc", coefficients, weights1, weights2),
+            rtol=1e-12,
+        )
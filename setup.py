@@ -157,6 +157,7 @@ INSTALL_REQUIRES = [
     "h5py",
     "numpy",
     "obspy >= 1.2.1",
+    "scipy >= 1.4",
     "tornado>=6.0.0",
     "requests",
     "geographiclib",